@@ -1,21 +1,46 @@
 """
 AI Agent service for natural language interactions and explanations
 """
-from typing import List, Dict, Any, Optional
+import asyncio
+import hashlib
+import json
+import re
+from typing import AsyncIterator, List, Dict, Any, FrozenSet, Optional, Set, Tuple
 from datetime import datetime
+import httpx
 import structlog
-from anthropic import Anthropic
+from anthropic import AsyncAnthropic
 
 from app.core.config import settings
 from app.models.schemas import (
     ExplanationMode, ExplanationRequest, ExplanationResponse,
-    ContextualQuery, ChatMessage, Location
+    ContextualQuery, ChatMessage, Location, LocationFast
 )
-from app.services.satellite_service import satellite_service
+from app.services.cache import EXPLAIN_CACHE_TTL, get_cached, set_cached
+from app.services.satellite_service import get_satellite_service
 from app.services.space_weather_service import space_weather_service
 
 logger = structlog.get_logger()
 
+def _fmt_clock(dt: datetime) -> str:
+    """
+    Format a time like strftime('%I:%M %p') with plain arithmetic,
+    avoiding the per-call locale lock and format-string parse
+    """
+    return f"{dt.hour % 12 or 12:02d}:{dt.minute:02d} {'AM' if dt.hour < 12 else 'PM'}"
+
+
+# Opt in to Anthropic prompt caching so static prompt prefixes are
+# encoded once provider-side instead of per request
+PROMPT_CACHING_HEADERS = {"anthropic-beta": "prompt-caching-2024-07-31"}
+
+# Keywords that trigger live context fetches, grouped by context tag
+CONTEXT_KEYWORDS = {
+    "weather": frozenset({"weather", "gps", "storm", "kp", "flare", "aurora", "cme"}),
+    "iss": frozenset({"iss", "satellite", "overhead", "visible", "pass", "tonight"}),
+}
+
+
 
 class SpaceAgentService:
     """
@@ -23,37 +48,50 @@ class SpaceAgentService:
     and multi-mode explanations
     """
     
-    # Knowledge base snippets (in production, load from files)
+    # Knowledge base snippets (in production, load from files); each
+    # entry declares the keywords that select it, so adding a snippet
+    # never requires touching the search code
     KB_SNIPPETS = {
         "kp_index": {
             "content": "The Kp index is a geomagnetic activity index ranging from 0-9. "
                       "It measures disturbances in Earth's magnetic field caused by solar activity. "
                       "Values 0-4 are quiet, 5-6 are active/minor storm, 7-8 are moderate/strong storm, "
                       "9 is severe storm. Higher Kp can affect GPS, radio, satellites, and cause auroras.",
-            "source": "NOAA Space Weather Prediction Center"
+            "source": "NOAA Space Weather Prediction Center",
+            "keywords": frozenset({"kp", "geomagnetic", "magnetic"}),
         },
         "cme": {
             "content": "A Coronal Mass Ejection (CME) is a massive burst of solar wind and magnetic fields "
                       "rising above the solar corona or being released into space. CMEs can eject billions of "
                       "tons of coronal material at speeds of 100-3000 km/s. Earth-directed CMEs can trigger "
                       "geomagnetic storms, affecting satellites, communications, and power grids.",
-            "source": "NASA Space Weather Guide"
+            "source": "NASA Space Weather Guide",
+            "keywords": frozenset({"cme", "coronal", "mass ejection"}),
         },
         "solar_flare": {
             "content": "Solar flares are intense bursts of radiation from the release of magnetic energy. "
                       "They're classified by X-ray brightness: C (weak), M (medium), X (strong). "
                       "Each class is 10x stronger than the previous. Flares can disrupt radio communications "
                       "and navigation systems on the sunlit side of Earth.",
-            "source": "NASA Solar Dynamics Observatory"
+            "source": "NASA Solar Dynamics Observatory",
+            "keywords": frozenset({"flare", "solar flare", "x-class", "m-class"}),
         },
         "leo": {
             "content": "Low Earth Orbit (LEO) is between 160-2000 km altitude. LEO satellites orbit Earth "
                       "in ~90 minutes. Most human spaceflight occurs here (ISS at ~400km). LEO satellites "
                       "experience more atmospheric drag and require periodic reboosts.",
-            "source": "ESA Space Environment Statistics"
+            "source": "ESA Space Environment Statistics",
+            "keywords": frozenset({"leo", "orbit", "altitude"}),
         },
     }
     
+    # Shared preamble for every explanation mode
+    BASE_PROMPT = (
+        "You are a space weather and satellite tracking expert. "
+        "You explain space phenomena clearly and accurately. "
+        "When live context is provided, incorporate it naturally into your response. "
+    )
+
     # Mode-specific system prompts
     MODE_PROMPTS = {
         ExplanationMode.QUICK: (
@@ -75,50 +113,171 @@ class SpaceAgentService:
     }
     
     def __init__(self):
-        self.client = Anthropic(api_key=settings.ANTHROPIC_API_KEY) if settings.ANTHROPIC_API_KEY else None
+        if settings.ANTHROPIC_API_KEY:
+            # Async client so Claude round-trips don't block the event loop;
+            # pool sized generously to avoid socket starvation under load
+            self.client = AsyncAnthropic(
+                api_key=settings.ANTHROPIC_API_KEY,
+                max_retries=3,
+                http_client=httpx.AsyncClient(
+                    limits=httpx.Limits(max_connections=100)
+                ),
+            )
+        else:
+            self.client = None
         self.model = "claude-sonnet-4-20250514"
+        self._keyword_re, self._keyword_tags = self._build_classifier()
+        # Citation source dicts are static per snippet; build them once
+        # so explain never allocates them on the hot path
+        for snippet in self.KB_SNIPPETS.values():
+            snippet.setdefault("source_obj", {
+                "title": snippet["source"],
+                "snippet": snippet["content"][:100] + "..."
+            })
+        # System prompt blocks per mode, built once; the shared base
+        # prompt carries cache_control so Anthropic's prompt cache can
+        # reuse its encoding across modes
+        self._system_blocks = {
+            mode: [
+                {
+                    "type": "text",
+                    "text": self.BASE_PROMPT,
+                    "cache_control": {"type": "ephemeral"},
+                },
+                {"type": "text", "text": mode_prompt},
+            ]
+            for mode, mode_prompt in self.MODE_PROMPTS.items()
+        }
+        # Bound concurrent Claude fan-out for batch requests
+        self._batch_semaphore = asyncio.Semaphore(
+            max(1, settings.RATE_LIMIT_REQUESTS // 10)
+        )
+        # Global bound on in-flight Claude calls so traffic bursts don't
+        # trip provider-side rate limits into retry storms
+        self._claude_semaphore = asyncio.Semaphore(settings.CLAUDE_MAX_CONCURRENCY)
+
+    def set_http_client(self, http_client: httpx.AsyncClient) -> None:
+        """Rebuild the Claude client on the shared application HTTP pool"""
+        if settings.ANTHROPIC_API_KEY:
+            self.client = AsyncAnthropic(
+                api_key=settings.ANTHROPIC_API_KEY,
+                max_retries=3,
+                http_client=http_client,
+            )
+
+    @classmethod
+    def _build_classifier(
+        cls
+    ) -> Tuple[re.Pattern, Dict[str, FrozenSet[Tuple[str, str]]]]:
+        """
+        Compile all trigger keywords into a single alternation pattern
+
+        One pass of the C regex engine over the lowercased query
+        classifies both live-context needs and KB snippet matches; the
+        \\b anchors keep short keywords like "kp" from firing inside
+        unrelated words. A keyword may carry several tags (e.g. "kp"
+        triggers weather context and the kp_index snippet), and KB
+        keywords come straight from the snippet metadata.
+        """
+        tags: Dict[str, Set[Tuple[str, str]]] = {}
+        for tag, words in CONTEXT_KEYWORDS.items():
+            for word in words:
+                tags.setdefault(word, set()).add(("ctx", tag))
+        for kb_key, snippet in cls.KB_SNIPPETS.items():
+            for word in snippet["keywords"]:
+                tags.setdefault(word, set()).add(("kb", kb_key))
+
+        # The substring scan this replaced also matched inside inflected
+        # words; register simple plural variants ("flares", "passes") so
+        # common phrasings keep triggering the same tags
+        for word in list(tags):
+            plural = word + (
+                "es" if word.endswith(("s", "x", "z", "ch", "sh")) else "s"
+            )
+            tags.setdefault(plural, set()).update(tags[word])
+
+        # A phrase match consumes the text of any keyword inside it
+        # ("solar flare" hides "flare"), so fold contained keywords'
+        # tags into the phrase up front
+        for word, word_tags in tags.items():
+            for other, other_tags in tags.items():
+                if other != word and other in word:
+                    word_tags.update(other_tags)
+
+        # Longest alternative first so phrases win over their prefixes
+        pattern = re.compile(
+            r"\b(?:"
+            + "|".join(re.escape(w) for w in sorted(tags, key=len, reverse=True))
+            + r")\b"
+        )
+        return pattern, {w: frozenset(t) for w, t in tags.items()}
+
+    def _classify(self, query_lower: str) -> Set[Tuple[str, str]]:
+        """Classify a lowercased query in one pass of the keyword pattern"""
+        hits: Set[Tuple[str, str]] = set()
+        for match in self._keyword_re.finditer(query_lower):
+            hits.update(self._keyword_tags[match.group(0)])
+        return hits
     
+    async def _build_live_context(self, query: ContextualQuery) -> List[str]:
+        """Fetch the live context snippets relevant to a query"""
+        context_parts = []
+
+        if query.include_live_context:
+            # Decide which live sources are relevant
+            hits = self._classify(query.query.lower())
+            need_weather = ("ctx", "weather") in hits
+            need_iss = query.location and ("ctx", "iss") in hits
+
+            # Fetch all relevant sources concurrently
+            tasks = []
+            if need_weather:
+                tasks.append(("weather", space_weather_service.get_current_status()))
+            if need_iss:
+                tasks.append(("iss", get_satellite_service().get_next_iss_pass(
+                    LocationFast.from_model(query.location)
+                )))
+
+            if tasks:
+                results = await asyncio.gather(
+                    *(coro for _, coro in tasks),
+                    return_exceptions=True
+                )
+
+                for (tag, _), result in zip(tasks, results):
+                    if isinstance(result, Exception):
+                        logger.error(
+                            "Failed to fetch live context",
+                            source=tag,
+                            error=str(result)
+                        )
+                    elif tag == "weather":
+                        context_parts.append(
+                            f"Current space weather: {result.summary}"
+                        )
+                    elif tag == "iss" and result:
+                        context_parts.append(
+                            f"Next ISS pass: {_fmt_clock(result.start_time)} "
+                            f"({result.max_elevation:.0f}° elevation)"
+                        )
+
+        return context_parts
+
     async def handle_contextual_query(
         self,
         query: ContextualQuery
     ) -> str:
         """
         Handle a query with automatic live context inclusion
-        
+
         Args:
             query: User query with context preferences
-            
+
         Returns:
             Agent response with live data when relevant
         """
-        # Build context
-        context_parts = []
-        
-        if query.include_live_context:
-            # Add space weather if relevant
-            if any(word in query.query.lower() for word in 
-                   ["weather", "gps", "storm", "kp", "flare", "aurora", "cme"]):
-                try:
-                    status = await space_weather_service.get_current_status()
-                    context_parts.append(
-                        f"Current space weather: {status.summary}"
-                    )
-                except Exception as e:
-                    logger.error("Failed to fetch space weather", error=str(e))
-            
-            # Add satellite passes if relevant and location provided
-            if query.location and any(word in query.query.lower() for word in
-                                     ["iss", "satellite", "overhead", "visible", "pass", "tonight"]):
-                try:
-                    next_pass = await satellite_service.get_next_iss_pass(query.location)
-                    if next_pass:
-                        context_parts.append(
-                            f"Next ISS pass: {next_pass.start_time.strftime('%I:%M %p')} "
-                            f"({next_pass.max_elevation:.0f}° elevation)"
-                        )
-                except Exception as e:
-                    logger.error("Failed to fetch satellite pass", error=str(e))
-        
+        context_parts = await self._build_live_context(query)
+
         # Build full prompt
         system_prompt = self._build_system_prompt(query.explanation_mode)
         
@@ -131,12 +290,15 @@ class SpaceAgentService:
             return self._fallback_response(query.query, context_parts)
         
         try:
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=1000,
-                system=system_prompt,
-                messages=[{"role": "user", "content": user_message}]
-            )
+            async with self._claude_semaphore:
+                response = await self.client.messages.create(
+                    model=self.model,
+                    max_tokens=1000,
+                    system=system_prompt,
+                    messages=[{"role": "user", "content": user_message}],
+                    extra_headers=PROMPT_CACHING_HEADERS,
+                    timeout=30.0
+                )
             
             return response.content[0].text
             
@@ -144,6 +306,76 @@ class SpaceAgentService:
             logger.error("Claude API error", error=str(e))
             return self._fallback_response(query.query, context_parts)
     
+    async def stream_contextual_query(
+        self,
+        query: ContextualQuery
+    ) -> AsyncIterator[str]:
+        """
+        Stream a response to a contextual query as Server-Sent Events
+
+        Args:
+            query: User query with context preferences
+
+        Yields:
+            SSE-framed text deltas, finishing with a done marker, so
+            clients see the first tokens at first-token latency instead
+            of waiting for the full message
+        """
+        context_parts = await self._build_live_context(query)
+
+        system_prompt = self._build_system_prompt(query.explanation_mode)
+
+        user_message = query.query
+        if context_parts:
+            user_message = f"Live context:\n" + "\n".join(context_parts) + "\n\n" + query.query
+
+        if not self.client:
+            fallback = self._fallback_response(query.query, context_parts)
+            yield f"data: {json.dumps({'delta': fallback})}\n\n"
+            yield f"data: {json.dumps({'done': True})}\n\n"
+            return
+
+        try:
+            async with self._claude_semaphore:
+                async with self.client.messages.stream(
+                    model=self.model,
+                    max_tokens=1000,
+                    system=system_prompt,
+                    messages=[{"role": "user", "content": user_message}],
+                    extra_headers=PROMPT_CACHING_HEADERS
+                ) as stream:
+                    async for text in stream.text_stream:
+                        yield f"data: {json.dumps({'delta': text})}\n\n"
+        except Exception as e:
+            logger.error("Claude API error in stream", error=str(e))
+            fallback = self._fallback_response(query.query, context_parts)
+            yield f"data: {json.dumps({'delta': fallback})}\n\n"
+
+        yield f"data: {json.dumps({'done': True})}\n\n"
+
+    async def handle_contextual_query_batch(
+        self,
+        queries: List[ContextualQuery]
+    ) -> List[str]:
+        """
+        Handle many contextual queries concurrently
+
+        Args:
+            queries: User queries with context preferences
+
+        Returns:
+            Agent responses in input order
+
+        Shared live-context fetches are collapsed by the status TTL
+        cache, and Claude calls fan out under a bounded semaphore so a
+        large batch cannot saturate provider rate limits.
+        """
+        async def run_one(query: ContextualQuery) -> str:
+            async with self._batch_semaphore:
+                return await self.handle_contextual_query(query)
+
+        return list(await asyncio.gather(*(run_one(q) for q in queries)))
+
     async def explain(
         self,
         request: ExplanationRequest
@@ -157,6 +389,16 @@ class SpaceAgentService:
         Returns:
             Detailed explanation with sources
         """
+        # Identical (query, mode, citations) requests share one Claude call
+        cache_key = "explain:" + hashlib.blake2b(
+            f"{request.mode}|{request.query}|{request.include_citations}".encode(),
+            digest_size=16
+        ).hexdigest()
+
+        cached = await get_cached(cache_key)
+        if cached:
+            return ExplanationResponse.model_validate_json(cached)
+
         # Search knowledge base for relevant content
         kb_results = self._search_kb(request.query)
         
@@ -169,36 +411,45 @@ class SpaceAgentService:
             kb_context = "\n\nRelevant knowledge:\n"
             for result in kb_results[:3]:
                 kb_context += f"- {result['content']}\n  Source: {result['source']}\n"
-                sources.append({
-                    "title": result["source"],
-                    "snippet": result["content"][:100] + "..."
-                })
+            sources = [result["source_obj"] for result in kb_results[:3]]
         
-        user_message = f"{request.query}{kb_context}"
+        # KB snippets are static, so they join the cacheable system
+        # prefix rather than the per-user message
+        if kb_context:
+            system_prompt = system_prompt + [{
+                "type": "text",
+                "text": kb_context,
+                "cache_control": {"type": "ephemeral"},
+            }]
         
-        # Get explanation
+        # Get explanation; only real Claude answers are worth caching
+        cacheable = False
         if not self.client:
-            explanation = self._fallback_explanation(request.query, request.mode)
+            explanation = self._fallback_explanation(request.query, request.mode, kb_results)
             citations = [r["source"] for r in kb_results[:2]] if kb_results else []
             confidence = 0.7
         else:
             try:
-                response = self.client.messages.create(
-                    model=self.model,
-                    max_tokens=1500,
-                    system=system_prompt,
-                    messages=[{"role": "user", "content": user_message}]
-                )
+                async with self._claude_semaphore:
+                    response = await self.client.messages.create(
+                        model=self.model,
+                        max_tokens=1500,
+                        system=system_prompt,
+                        messages=[{"role": "user", "content": request.query}],
+                        extra_headers=PROMPT_CACHING_HEADERS,
+                        timeout=30.0
+                    )
                 explanation = response.content[0].text
                 citations = [r["source"] for r in kb_results] if kb_results else []
                 confidence = 0.9 if kb_results else 0.6
+                cacheable = True
             except Exception as e:
                 logger.error("Claude API error in explain", error=str(e))
-                explanation = self._fallback_explanation(request.query, request.mode)
+                explanation = self._fallback_explanation(request.query, request.mode, kb_results)
                 citations = []
                 confidence = 0.5
         
-        return ExplanationResponse(
+        result = ExplanationResponse(
             query=request.query,
             mode=request.mode,
             explanation=explanation,
@@ -206,41 +457,30 @@ class SpaceAgentService:
             confidence=confidence,
             sources=sources
         )
+
+        if cacheable:
+            await set_cached(cache_key, result.model_dump_json(), EXPLAIN_CACHE_TTL)
+
+        return result
     
-    def _build_system_prompt(self, mode: ExplanationMode) -> str:
-        """Build system prompt based on explanation mode"""
-        base_prompt = (
-            "You are a space weather and satellite tracking expert. "
-            "You explain space phenomena clearly and accurately. "
-            "When live context is provided, incorporate it naturally into your response. "
+    def _build_system_prompt(self, mode: ExplanationMode) -> List[Dict[str, Any]]:
+        """Look up the precomputed system prompt blocks for a mode"""
+        return self._system_blocks.get(
+            mode, self._system_blocks[ExplanationMode.QUICK]
         )
-        
-        mode_specific = self.MODE_PROMPTS.get(mode, self.MODE_PROMPTS[ExplanationMode.QUICK])
-        
-        return base_prompt + mode_specific
     
     def _search_kb(self, query: str) -> List[Dict[str, str]]:
         """
         Simple keyword-based KB search
         In production: use vector embeddings and semantic search
         """
-        query_lower = query.lower()
-        results = []
-        
-        # Simple keyword matching
-        if any(word in query_lower for word in ["kp", "geomagnetic", "magnetic"]):
-            results.append(self.KB_SNIPPETS["kp_index"])
-        
-        if any(word in query_lower for word in ["cme", "coronal", "mass ejection"]):
-            results.append(self.KB_SNIPPETS["cme"])
-        
-        if any(word in query_lower for word in ["flare", "solar flare", "x-class", "m-class"]):
-            results.append(self.KB_SNIPPETS["solar_flare"])
-        
-        if any(word in query_lower for word in ["leo", "orbit", "altitude"]):
-            results.append(self.KB_SNIPPETS["leo"])
-        
-        return results
+        hits = self._classify(query.lower())
+
+        # Preserve KB declaration order for stable ranking
+        return [
+            snippet for key, snippet in self.KB_SNIPPETS.items()
+            if ("kb", key) in hits
+        ]
     
     def _fallback_response(self, query: str, context: List[str]) -> str:
         """Fallback response when Claude API unavailable"""
@@ -254,10 +494,16 @@ class SpaceAgentService:
                    "Please check the space weather and satellite tracking dashboards "
                    "for current information.")
     
-    def _fallback_explanation(self, query: str, mode: ExplanationMode) -> str:
+    def _fallback_explanation(
+        self,
+        query: str,
+        mode: ExplanationMode,
+        kb_results: Optional[List[Dict[str, str]]] = None
+    ) -> str:
         """Fallback explanation when Claude API unavailable"""
-        kb_results = self._search_kb(query)
-        
+        if kb_results is None:
+            kb_results = self._search_kb(query)
+
         if kb_results:
             return kb_results[0]["content"]
         
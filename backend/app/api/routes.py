@@ -1,16 +1,21 @@
 """
 API Routes for Space Agent
 """
-from fastapi import APIRouter, HTTPException, Query
+import asyncio
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 from typing import Optional, List
 from datetime import datetime
 
+from app.core.config import settings
 from app.models.schemas import (
-    Location, SatellitePass, SatelliteProfile, SatellitePosition, SpaceWeatherStatus,
+    Location, LocationFast, SatellitePass, SatelliteProfile, SatellitePosition, SpaceWeatherStatus,
     ExplanationRequest, ExplanationResponse, ContextualQuery,
     AlertSubscription, SpaceEvent, ActivityFeed
 )
-from app.services.satellite_service import satellite_service
+from app.services._cache import async_cached
+from app.services.satellite_service import SatelliteService, get_satellite_service
 from app.services.space_weather_service import space_weather_service
 from app.agents.space_agent import space_agent
 
@@ -26,11 +31,13 @@ async def get_overhead_satellites(
     lon: float = Query(..., ge=-180, le=180, description="Longitude"),
     alt: float = Query(0, ge=0, description="Altitude in meters"),
     hours: int = Query(24, ge=1, le=168, description="Time window in hours"),
-    min_elevation: float = Query(10, ge=0, le=90, description="Minimum elevation")
+    min_elevation: float = Query(10, ge=0, le=90, description="Minimum elevation"),
+    satellite_service: SatelliteService = Depends(get_satellite_service)
 ):
     """Get satellites passing overhead for a location"""
-    location = Location(latitude=lat, longitude=lon, altitude=alt)
-    
+    # Query params are already validated; skip the Pydantic constructor
+    location = LocationFast(latitude=lat, longitude=lon, altitude=alt)
+
     try:
         passes = await satellite_service.get_overhead_satellites(
             location=location,
@@ -47,10 +54,11 @@ async def get_next_iss_pass(
     lat: float = Query(..., ge=-90, le=90),
     lon: float = Query(..., ge=-180, le=180),
     alt: float = Query(0, ge=0),
-    min_elevation: float = Query(30, ge=0, le=90)
+    min_elevation: float = Query(30, ge=0, le=90),
+    satellite_service: SatelliteService = Depends(get_satellite_service)
 ):
     """Get next good ISS pass"""
-    location = Location(latitude=lat, longitude=lon, altitude=alt)
+    location = LocationFast(latitude=lat, longitude=lon, altitude=alt)
     
     try:
         pass_info = await satellite_service.get_next_iss_pass(
@@ -72,7 +80,9 @@ async def get_next_iss_pass(
 
 
 @satellite_router.get("/iss/position", response_model=SatellitePosition)
-async def get_iss_position():
+async def get_iss_position(
+    satellite_service: SatelliteService = Depends(get_satellite_service)
+):
     """Get ISS current position"""
     try:
         position = await satellite_service.get_iss_position()
@@ -82,7 +92,10 @@ async def get_iss_position():
 
 
 @satellite_router.get("/profile/{satellite_name}", response_model=SatelliteProfile)
-async def get_satellite_profile(satellite_name: str):
+async def get_satellite_profile(
+    satellite_name: str,
+    satellite_service: SatelliteService = Depends(get_satellite_service)
+):
     """Get detailed satellite profile"""
     try:
         profile = await satellite_service.get_satellite_profile(satellite_name)
@@ -103,12 +116,24 @@ async def get_satellite_profile(satellite_name: str):
 # Space Weather routes
 weather_router = APIRouter(prefix="/space-weather", tags=["Space Weather"])
 
+
+@async_cached(ttl=settings.SPACE_WEATHER_CACHE_TTL)
+async def _serialized_status() -> bytes:
+    """Pre-serialized status body, shared by every /status caller"""
+    status = await space_weather_service.get_current_status()
+    return orjson.dumps(status.model_dump(mode="json"))
+
+
 @weather_router.get("/status", response_model=SpaceWeatherStatus)
 async def get_space_weather_status():
     """Get current space weather status"""
     try:
-        status = await space_weather_service.get_current_status()
-        return status
+        # Returning bytes directly skips re-serializing the model per
+        # request; response_model stays for the OpenAPI schema
+        return Response(
+            content=await _serialized_status(),
+            media_type="application/json"
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -139,6 +164,30 @@ async def contextual_query(query: ContextualQuery):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@agent_router.post("/query:stream")
+async def contextual_query_stream(query: ContextualQuery):
+    """
+    Ask the agent a question and stream the answer as Server-Sent Events
+    """
+    return StreamingResponse(
+        space_agent.stream_contextual_query(query),
+        media_type="text/event-stream"
+    )
+
+
+@agent_router.post("/query:batch")
+async def contextual_query_batch(queries: List[ContextualQuery]):
+    """
+    Ask the agent many questions in one request; answers are generated
+    concurrently and returned in input order
+    """
+    try:
+        responses = await space_agent.handle_contextual_query_batch(queries)
+        return {"responses": responses, "timestamp": datetime.utcnow()}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @agent_router.post("/explain", response_model=ExplanationResponse)
 async def explain(request: ExplanationRequest):
     """
@@ -154,28 +203,30 @@ async def explain(request: ExplanationRequest):
 # Activity Feed routes
 feed_router = APIRouter(prefix="/feed", tags=["Activity Feed"])
 
-@feed_router.get("/today", response_model=ActivityFeed)
-async def get_today_feed():
-    """Get today's space activity feed"""
-    # Demo implementation
-    events = []
-    
-    try:
-        # Add space weather event
-        status = await space_weather_service.get_current_status()
-        events.append(SpaceEvent(
-            event_id="sw-" + datetime.utcnow().strftime("%Y%m%d"),
-            event_type="space_weather",
-            timestamp=datetime.utcnow(),
-            title="Space Weather Update",
-            description=status.summary,
-            severity=None,
-            data={"kp": status.kp_current}
-        ))
-        
-    except Exception as e:
-        pass
-    
+async def _space_weather_event() -> SpaceEvent:
+    """Build today's space weather event"""
+    status = await space_weather_service.get_current_status()
+    now = datetime.utcnow()
+    return SpaceEvent(
+        event_id="sw-" + now.strftime("%Y%m%d"),
+        event_type="space_weather",
+        timestamp=now,
+        title="Space Weather Update",
+        description=status.summary,
+        severity=None,
+        data={"kp": status.kp_current}
+    )
+
+
+@async_cached(ttl=60)
+async def _build_today_feed() -> ActivityFeed:
+    """Assemble the feed; event builders run concurrently"""
+    # More builders (launches, flares) slot in here as events grow
+    builders = [_space_weather_event()]
+
+    results = await asyncio.gather(*builders, return_exceptions=True)
+    events = [e for e in results if isinstance(e, SpaceEvent)]
+
     return ActivityFeed(
         period="today",
         events=events,
@@ -183,6 +234,12 @@ async def get_today_feed():
     )
 
 
+@feed_router.get("/today", response_model=ActivityFeed)
+async def get_today_feed():
+    """Get today's space activity feed"""
+    return await _build_today_feed()
+
+
 # Include all routers
 api_router.include_router(satellite_router)
 api_router.include_router(weather_router)
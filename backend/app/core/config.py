@@ -36,6 +36,7 @@ class Settings(BaseSettings):
     # External APIs
     NOAA_SWPC_BASE_URL: str = Field(default="https://services.swpc.noaa.gov")
     LAUNCH_LIBRARY_BASE_URL: str = Field(default="https://ll.thespacedevs.com/2.2.0")
+    CELESTRAK_BASE_URL: str = Field(default="https://celestrak.org/NORAD/elements")
     
     # Demo Mode
     DEMO_MODE: bool = Field(default=False)
@@ -59,10 +60,12 @@ class Settings(BaseSettings):
     # Rate Limiting
     RATE_LIMIT_REQUESTS: int = Field(default=100)
     RATE_LIMIT_PERIOD: int = Field(default=60)
+    CLAUDE_MAX_CONCURRENCY: int = Field(default=20)
     
     # Background Tasks
     ENABLE_SCHEDULER: bool = Field(default=True)
     SPACE_WEATHER_UPDATE_INTERVAL: int = Field(default=300)  # 5 minutes
+    SPACE_WEATHER_CACHE_TTL: int = Field(default=60)  # shared status cache
     TLE_UPDATE_INTERVAL: int = Field(default=86400)  # 24 hours
     
     model_config = SettingsConfigDict(
@@ -0,0 +1,47 @@
+"""
+Shared outbound HTTP client with connection pooling
+
+Initialized from the application lifespan so every service reuses one
+keep-alive pool instead of paying a fresh TCP+TLS handshake per call.
+"""
+from typing import Optional
+
+import httpx
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def init_http_client() -> httpx.AsyncClient:
+    """Create the shared client; called once at startup"""
+    global _client
+    if _client is None:
+        # HTTP/2 multiplexes concurrent calls to the same host (the NOAA
+        # status gather) onto one connection; retries=1 absorbs a stale
+        # keep-alive socket without surfacing to callers
+        _client = httpx.AsyncClient(
+            timeout=httpx.Timeout(10.0),
+            transport=httpx.AsyncHTTPTransport(
+                retries=1,
+                http2=True,
+                limits=httpx.Limits(
+                    max_keepalive_connections=50,
+                    max_connections=100,
+                ),
+            ),
+        )
+    return _client
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared client, creating it on first use"""
+    if _client is None:
+        return init_http_client()
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the shared client; called once at shutdown"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -1,10 +1,11 @@
 """
 Core data models for Space Agent
 """
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 # Enums
@@ -42,15 +43,43 @@ class OrbitType(str, Enum):
 # Location Models
 class Location(BaseModel):
     """Geographic location"""
+    model_config = ConfigDict(frozen=True)
+
     latitude: float = Field(ge=-90, le=90)
     longitude: float = Field(ge=-180, le=180)
     altitude: float = Field(default=0, description="Altitude in meters")
     name: Optional[str] = None
 
 
+@dataclass(frozen=True, slots=True)
+class LocationFast:
+    """
+    Lightweight location for internal hot paths
+
+    Constructed without Pydantic validation — use `Location` at the API
+    boundary and convert once at the edge.
+    """
+    latitude: float
+    longitude: float
+    altitude: float = 0.0
+    name: Optional[str] = None
+
+    @classmethod
+    def from_model(cls, location: Location) -> "LocationFast":
+        """Convert a validated API Location"""
+        return cls(
+            location.latitude,
+            location.longitude,
+            location.altitude,
+            location.name,
+        )
+
+
 # Satellite Models
 class SatellitePass(BaseModel):
     """Satellite pass prediction"""
+    model_config = ConfigDict(frozen=True)
+
     satellite_name: str
     satellite_id: int
     start_time: datetime
@@ -244,6 +273,8 @@ class ContextualQuery(BaseModel):
 # Activity Feed Models
 class SpaceEvent(BaseModel):
     """Generic space event for activity feed"""
+    model_config = ConfigDict(frozen=True)
+
     event_id: str
     event_type: str
     timestamp: datetime
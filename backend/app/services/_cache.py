@@ -0,0 +1,42 @@
+"""
+Small in-process async TTL cache with single-flight misses
+"""
+import asyncio
+import functools
+import time
+from typing import Any, Callable, Dict, Tuple
+
+
+def async_cached(ttl: float) -> Callable:
+    """
+    Cache an async function's result for `ttl` seconds
+
+    Results are keyed by the call arguments (which must be hashable).
+    A per-key asyncio.Lock guards the miss path so N concurrent callers
+    collapse into a single upstream call instead of a thundering herd.
+    """
+    def decorator(func: Callable) -> Callable:
+        cache: Dict[Any, Tuple[float, Any]] = {}
+        locks: Dict[Any, asyncio.Lock] = {}
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+
+            entry = cache.get(key)
+            if entry and entry[0] > time.monotonic():
+                return entry[1]
+
+            lock = locks.setdefault(key, asyncio.Lock())
+            async with lock:
+                # Another caller may have refreshed while we waited
+                entry = cache.get(key)
+                if entry and entry[0] > time.monotonic():
+                    return entry[1]
+
+                value = await func(*args, **kwargs)
+                cache[key] = (time.monotonic() + ttl, value)
+                return value
+
+        return wrapper
+    return decorator
@@ -0,0 +1,41 @@
+"""
+Redis-backed response cache for expensive agent calls
+"""
+from typing import Optional
+
+import structlog
+from redis import asyncio as aioredis
+
+from app.core.config import settings
+
+logger = structlog.get_logger()
+
+# Cached explanations are canonical Q&A; keep them for a day
+EXPLAIN_CACHE_TTL = 86400
+
+_redis: Optional[aioredis.Redis] = None
+
+
+def _get_redis() -> aioredis.Redis:
+    """Lazily create the shared Redis client"""
+    global _redis
+    if _redis is None:
+        _redis = aioredis.from_url(settings.REDIS_URL, decode_responses=True)
+    return _redis
+
+
+async def get_cached(key: str) -> Optional[str]:
+    """Fetch a cached value; Redis outages degrade to a miss"""
+    try:
+        return await _get_redis().get(key)
+    except Exception as e:
+        logger.error("Redis get failed", key=key, error=str(e))
+        return None
+
+
+async def set_cached(key: str, value: str, ttl: int) -> None:
+    """Store a value with a TTL; Redis outages are logged and ignored"""
+    try:
+        await _get_redis().setex(key, ttl, value)
+    except Exception as e:
+        logger.error("Redis set failed", key=key, error=str(e))
@@ -2,21 +2,158 @@
 Satellite tracking service using N2YO API and Skyfield
 """
 import asyncio
+import bisect
+import functools
+import math
+import time
 from datetime import datetime, timedelta
-from typing import List, Optional, Tuple
-import structlog
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
 import httpx
+import numpy as np
+import orjson
+import structlog
+from scipy.optimize import brentq, minimize_scalar
+from sgp4.api import SatrecArray
 from skyfield.api import load, wgs84, EarthSatellite
 from skyfield.toposlib import GeographicPosition
 
 from app.core.config import settings
+from app.core.http import get_http_client
 from app.models.schemas import (
-    Location, SatellitePass, SatelliteProfile, 
+    LocationFast, SatellitePass, SatelliteProfile, 
     SatellitePosition, OrbitType
 )
 
 logger = structlog.get_logger()
 
+# Shared Skyfield timescale; load.timescale() parses leap-second and
+# delta-T tables, so it's built lazily instead of at worker import
+_timescale = None
+
+
+def _get_timescale():
+    """Build the timescale on first use; builtin tables skip any network fetch"""
+    global _timescale
+    if _timescale is None:
+        _timescale = load.timescale(builtin=True)
+    return _timescale
+
+
+# Commentary decision tables: label index = bisect over the thresholds.
+# Boundaries match the original branch cascades (strict > for elevation,
+# strict < for duration).
+_MAX_EL_THRESH = [30.0, 50.0, 70.0]
+_MAX_EL_LABEL = [
+    "Moderate pass, clear sky recommended.",
+    "Good pass, should be easy to spot.",
+    "High pass, very good viewing.",
+    "Overhead pass! Excellent viewing.",
+]
+_DURATION_THRESH = [180, 360]
+_DURATION_LABEL = ["Quick pass", "Standard duration", "Long pass"]
+
+# Demo pass templates: (static fields, start/max/end offsets from the
+# evening anchor). Built once so _get_demo_passes only fills in times
+# via model_construct instead of re-validating every field per request.
+_DEMO_PASS_TEMPLATES = [
+    (
+        {
+            "satellite_name": "ISS (ZARYA)",
+            "satellite_id": 25544,
+            "max_elevation": 63.0,
+            "start_azimuth": 225,  # SW
+            "max_azimuth": 180,
+            "end_azimuth": 45,  # NE
+            "magnitude": -3.5,
+            "duration_seconds": 360,
+            "worth_watching": True,
+            "commentary": "High pass, very good viewing. Standard duration (360s).",
+        },
+        timedelta(0), timedelta(minutes=3), timedelta(minutes=6),
+    ),
+    (
+        {
+            "satellite_name": "ISS (ZARYA)",
+            "satellite_id": 25544,
+            "max_elevation": 45.0,
+            "start_azimuth": 270,
+            "max_azimuth": 180,
+            "end_azimuth": 90,
+            "magnitude": -2.8,
+            "duration_seconds": 300,
+            "worth_watching": True,
+            "commentary": "Good pass, should be easy to spot. Standard duration (300s).",
+        },
+        timedelta(hours=13), timedelta(hours=13, minutes=2),
+        timedelta(hours=13, minutes=5),
+    ),
+]
+
+# WGS84 ellipsoid (km) for observer ECEF conversion
+_WGS84_A = 6378.137
+_WGS84_E2 = 6.69437999014e-3
+
+
+def _gmst_radians(jd_ut1: np.ndarray) -> np.ndarray:
+    """Greenwich mean sidereal time (IAU 1982) for the TEME->ECEF rotation"""
+    t = (jd_ut1 - 2451545.0) / 36525.0
+    seconds = (
+        67310.54841
+        + (876600.0 * 3600.0 + 8640184.812866) * t
+        + 0.093104 * t * t
+        - 6.2e-6 * t * t * t
+    )
+    return (seconds % 86400.0) * (np.pi / 43200.0)
+
+
+def _observer_frame(
+    location: LocationFast
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Observer ECEF position (km) and local east/north/up unit vectors"""
+    lat = np.radians(location.latitude)
+    lon = np.radians(location.longitude)
+    sin_lat, cos_lat = np.sin(lat), np.cos(lat)
+    sin_lon, cos_lon = np.sin(lon), np.cos(lon)
+
+    n = _WGS84_A / np.sqrt(1.0 - _WGS84_E2 * sin_lat * sin_lat)
+    h = location.altitude / 1000.0
+    position = np.array([
+        (n + h) * cos_lat * cos_lon,
+        (n + h) * cos_lat * sin_lon,
+        (n * (1.0 - _WGS84_E2) + h) * sin_lat,
+    ])
+
+    east = np.array([-sin_lon, cos_lon, 0.0])
+    north = np.array([-sin_lat * cos_lon, -sin_lat * sin_lon, cos_lat])
+    up = np.array([cos_lat * cos_lon, cos_lat * sin_lon, sin_lat])
+    return position, east, north, up
+
+
+@functools.lru_cache(maxsize=128)
+def _observer_frame_cached(
+    lat_q: float,
+    lon_q: float,
+    alt_q: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Observer frame keyed by quantized coordinates"""
+    return _observer_frame(LocationFast(lat_q, lon_q, alt_q))
+
+
+def _observer_frame_for(
+    location: LocationFast
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Observer frame for a location, shared across requests
+
+    Coordinates are quantized to ~11m (4 decimals) so repeated nearby
+    requests reuse one frame instead of redoing the ellipsoid math.
+    """
+    return _observer_frame_cached(
+        round(location.latitude, 4),
+        round(location.longitude, 4),
+        round(location.altitude, 0),
+    )
+
 
 class SatelliteService:
     """Service for satellite tracking and predictions"""
@@ -28,15 +165,180 @@ class SatelliteService:
         "TIANGONG": {"norad_id": "48274", "name": "TIANHE"},
     }
     
+    # N2YO pass predictions change on minute scales; also protects the
+    # limited per-hour API quota
+    PASS_CACHE_TTL = 600
+
+    # Keys embed caller-supplied coordinates, so bound the cache rather
+    # than letting the public endpoint grow it without limit
+    CACHE_MAX_ENTRIES = 256
+
+    # Sampling cadence for local pass prediction (seconds)
+    COARSE_STEP_S = 30.0
+
+    # Elevation slack (degrees) when screening satellites on the coarse
+    # grid, so near-threshold passes still reach refinement
+    COARSE_MARGIN_DEG = 5.0
+
+    # Demo pass list is anchored to the evening, so a minute of reuse
+    # is indistinguishable to callers
+    DEMO_CACHE_TTL = 60.0
+
+    # Profiles for the well-known satellites, validated once at class
+    # evaluation so lookups are a plain dict hit
+    _PROFILES: Dict[str, SatelliteProfile] = {
+        "ISS": SatelliteProfile(
+            satellite_id=25544,
+            name="International Space Station",
+            norad_id="25544",
+            purpose="Research laboratory and human spaceflight",
+            orbit_type=OrbitType.LEO,
+            altitude_km=408,
+            speed_kmh=27600,
+            country="International",
+            why_care="The ISS is a continuously inhabited space station where "
+                     "astronauts conduct scientific research in microgravity. "
+                     "It's the brightest satellite and often visible to the naked eye.",
+            recent_changes=None
+        ),
+        "HUBBLE": SatelliteProfile(
+            satellite_id=20580,
+            name="Hubble Space Telescope",
+            norad_id="20580",
+            purpose="Space telescope for astronomical observations",
+            orbit_type=OrbitType.LEO,
+            altitude_km=547,
+            speed_kmh=27300,
+            country="USA/ESA",
+            why_care="Hubble has revolutionized astronomy with stunning images "
+                     "and discoveries about the universe. Operating since 1990.",
+            recent_changes=None
+        ),
+        "TIANGONG": SatelliteProfile(
+            satellite_id=48274,
+            name="Tiangong Space Station",
+            norad_id="48274",
+            purpose="Chinese space station",
+            orbit_type=OrbitType.LEO,
+            altitude_km=390,
+            speed_kmh=27500,
+            country="China",
+            why_care="China's first long-term space station, continuously inhabited "
+                     "since 2022. Conducting scientific research and technology demos.",
+            recent_changes=None
+        ),
+    }
+
     def __init__(self):
         self.base_url = "https://api.n2yo.com/rest/v1/satellite"
         self.api_key = settings.N2YO_API_KEY
-        self.ts = load.timescale()
         self.tle_cache = {}
-        
+        self._cache = {}
+        self._cache_locks = {}
+        # Lowercase alias -> canonical key, so profile lookups avoid
+        # rescanning (and re-lowercasing) the catalog on every call
+        self._alias_index = {}
+        for key, info in self.SATELLITES.items():
+            self._alias_index[key.lower()] = key
+            self._alias_index[info["name"].lower()] = key
+        self._demo_cache: Optional[Tuple[float, List[SatellitePass]]] = None
+
+    @property
+    def ts(self):
+        """Shared Skyfield timescale, built on first use"""
+        return _get_timescale()
+
+    async def update_tle_cache(self) -> int:
+        """
+        Refresh cached TLEs from CelesTrak for the tracked satellites
+
+        Parsed EarthSatellite objects are stored by NORAD id so local
+        propagation can reuse them between refreshes.
+
+        Returns:
+            Number of satellites updated
+        """
+        url = f"{settings.CELESTRAK_BASE_URL}/gp.php"
+        updated = 0
+
+        for sat_key, sat_info in self.SATELLITES.items():
+            norad_id = sat_info["norad_id"]
+            try:
+                response = await get_http_client().get(
+                    url, params={"CATNR": norad_id, "FORMAT": "tle"}
+                )
+                response.raise_for_status()
+                lines = [l.strip() for l in response.text.strip().splitlines()]
+                if len(lines) >= 3:
+                    self.tle_cache[norad_id] = EarthSatellite(
+                        lines[1], lines[2], lines[0], self.ts
+                    )
+                    updated += 1
+            except Exception as e:
+                logger.error(
+                    "TLE update failed",
+                    satellite=sat_key,
+                    error=str(e)
+                )
+
+        return updated
+
+    async def _cached(
+        self,
+        key: str,
+        ttl: float,
+        fetch: Callable[[], Awaitable]
+    ):
+        """
+        Serve a value from the TTL cache, coalescing concurrent misses
+
+        A per-key lock means N simultaneous callers trigger exactly one
+        upstream fetch (single-flight).
+        """
+        entry = self._cache.get(key)
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+
+        lock = self._cache_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            entry = self._cache.get(key)
+            if entry and entry[0] > time.monotonic():
+                return entry[1]
+
+            # Drop the lock however the fetch settles; a key whose fetch
+            # keeps failing would otherwise park its lock forever. A
+            # dropped lock costs at worst one duplicate fetch.
+            try:
+                value = await fetch()
+            finally:
+                self._cache_locks.pop(key, None)
+
+            self._prune_cache()
+            self._cache[key] = (time.monotonic() + ttl, value)
+            return value
+
+    def _prune_cache(self) -> None:
+        """
+        Drop expired cache entries on each miss
+
+        If the cache is still at its bound afterwards, the entries
+        closest to expiry are evicted too. Locks need no pruning here:
+        _cached discards each key's lock as soon as its fetch settles,
+        so only in-flight fetches hold one.
+        """
+        now = time.monotonic()
+        for k in [k for k, (expiry, _) in self._cache.items() if expiry <= now]:
+            del self._cache[k]
+
+        overflow = len(self._cache) - self.CACHE_MAX_ENTRIES + 1
+        if overflow > 0:
+            oldest = sorted(self._cache, key=lambda k: self._cache[k][0])
+            for k in oldest[:overflow]:
+                del self._cache[k]
+
     async def get_overhead_satellites(
         self,
-        location: Location,
+        location: LocationFast,
         time_window_hours: int = 24,
         min_elevation: float = 10
     ) -> List[SatellitePass]:
@@ -52,35 +354,62 @@ class SatelliteService:
             List of satellite passes
         """
         if settings.DEMO_MODE:
-            return self._get_demo_passes(location)
-        
-        passes = []
-        
-        # Get passes for each major satellite
-        for sat_key, sat_info in self.SATELLITES.items():
+            if (
+                self._demo_cache is not None
+                and time.monotonic() - self._demo_cache[0] < self.DEMO_CACHE_TTL
+            ):
+                return self._demo_cache[1]
+            demo_passes = self._get_demo_passes(location)
+            self._demo_cache = (time.monotonic(), demo_passes)
+            return demo_passes
+
+        # Prefer local batched propagation once the TLE cache is warm;
+        # one SatrecArray call replaces a network round-trip per satellite
+        if all(
+            info["norad_id"] in self.tle_cache
+            for info in self.SATELLITES.values()
+        ):
             try:
-                sat_passes = await self._get_satellite_passes(
+                return self._compute_passes_local(
+                    location, time_window_hours, min_elevation
+                )
+            except Exception as e:
+                logger.error("Local pass prediction failed", error=str(e))
+
+        passes = []
+
+        # Fetch passes for all major satellites concurrently
+        results = await asyncio.gather(
+            *(
+                self._get_satellite_passes(
                     norad_id=sat_info["norad_id"],
                     location=location,
                     days=time_window_hours // 24 or 1,
                     min_elevation=min_elevation
                 )
-                passes.extend(sat_passes)
-            except Exception as e:
+                for sat_info in self.SATELLITES.values()
+            ),
+            return_exceptions=True
+        )
+
+        for sat_key, result in zip(self.SATELLITES, results):
+            if isinstance(result, Exception):
                 logger.error(
                     "Failed to get passes",
                     satellite=sat_key,
-                    error=str(e)
+                    error=str(result)
                 )
-        
+            else:
+                passes.extend(result)
+
         # Sort by start time
         passes.sort(key=lambda p: p.start_time)
-        
+
         return passes
     
     async def get_next_iss_pass(
         self,
-        location: Location,
+        location: LocationFast,
         min_elevation: float = 30
     ) -> Optional[SatellitePass]:
         """Get the next good ISS pass"""
@@ -116,11 +445,10 @@ class SatelliteService:
         
         url = f"{self.base_url}/positions/{norad_id}/0/0/0/1"
         params = {"apiKey": self.api_key}
-        
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, params=params, timeout=10.0)
-            response.raise_for_status()
-            data = response.json()
+
+        response = await get_http_client().get(url, params=params)
+        response.raise_for_status()
+        data = response.json()
         
         if not data.get("positions") or len(data["positions"]) == 0:
             raise Exception("No position data available")
@@ -143,36 +471,83 @@ class SatelliteService:
     async def _get_satellite_passes(
         self,
         norad_id: str,
-        location: Location,
+        location: LocationFast,
         days: int = 1,
         min_elevation: float = 10
     ) -> List[SatellitePass]:
-        """Get passes from N2YO API"""
-        
+        """Get passes for a satellite, cached per location/window"""
+        # Quantize lat/lon to ~1km so nearby requests share an entry
+        key = (
+            f"pass:{norad_id}:{location.latitude:.2f}:{location.longitude:.2f}:"
+            f"{location.altitude:.0f}:{days}:{min_elevation}"
+        )
+        return await self._cached(
+            key,
+            self.PASS_CACHE_TTL,
+            lambda: self._fetch_passes(norad_id, location, days, min_elevation)
+        )
+
+    async def _fetch_passes(
+        self,
+        norad_id: str,
+        location: LocationFast,
+        days: int = 1,
+        min_elevation: float = 10
+    ) -> List[SatellitePass]:
+        """Fetch passes from N2YO API"""
+
         url = f"{self.base_url}/visualpasses/{norad_id}/" \
               f"{location.latitude}/{location.longitude}/{location.altitude}/{days}/{min_elevation}"
         
         params = {"apiKey": self.api_key}
-        
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, params=params, timeout=10.0)
-            response.raise_for_status()
-            data = response.json()
-        
+
+        response = await get_http_client().get(url, params=params)
+        # N2YO serves HTML error pages when rate-limited; reject those
+        # before paying for a JSON parse
+        if response.status_code != 200 or \
+           "application/json" not in response.headers.get("content-type", ""):
+            raise httpx.HTTPStatusError(
+                f"Unexpected N2YO response ({response.status_code})",
+                request=response.request,
+                response=response
+            )
+        data = orjson.loads(response.content)
+
+        raw_passes = data.get("passes", [])
+        if not raw_passes:
+            return []
+
+        satname = data["info"]["satname"]
+        satid = int(data["info"]["satid"])
+
+        # Batch-convert the three epoch columns; datetime64[s] -> datetime
+        # yields naive UTC, matching the rest of the service
+        starts = np.array(
+            [p["startUTC"] for p in raw_passes], dtype="int64"
+        ).view("datetime64[s]")
+        maxes = np.array(
+            [p["maxUTC"] for p in raw_passes], dtype="int64"
+        ).view("datetime64[s]")
+        ends = np.array(
+            [p["endUTC"] for p in raw_passes], dtype="int64"
+        ).view("datetime64[s]")
+
         passes = []
-        for pass_data in data.get("passes", []):
+        # Materialize in chronological order so no Python sort is needed
+        for i in np.argsort(starts, kind="stable"):
+            pass_data = raw_passes[i]
             # Calculate if worth watching (elevation > 40° or very bright)
             worth_watching = (
-                pass_data["maxEl"] > 40 or 
+                pass_data["maxEl"] > 40 or
                 (pass_data.get("mag", 5) < 0)
             )
-            
+
             sat_pass = SatellitePass(
-                satellite_name=data["info"]["satname"],
-                satellite_id=int(data["info"]["satid"]),
-                start_time=datetime.fromtimestamp(pass_data["startUTC"]),
-                max_elevation_time=datetime.fromtimestamp(pass_data["maxUTC"]),
-                end_time=datetime.fromtimestamp(pass_data["endUTC"]),
+                satellite_name=satname,
+                satellite_id=satid,
+                start_time=starts[i].astype(datetime),
+                max_elevation_time=maxes[i].astype(datetime),
+                end_time=ends[i].astype(datetime),
                 max_elevation=pass_data["maxEl"],
                 start_azimuth=pass_data["startAz"],
                 max_azimuth=pass_data["maxAz"],
@@ -183,9 +558,197 @@ class SatelliteService:
                 commentary=self._generate_commentary(pass_data, worth_watching)
             )
             passes.append(sat_pass)
-        
+
         return passes
     
+    def _compute_passes_local(
+        self,
+        location: LocationFast,
+        time_window_hours: int,
+        min_elevation: float
+    ) -> List[SatellitePass]:
+        """
+        Predict passes with one batched SGP4 call over the TLE cache
+
+        SatrecArray propagates every cached satellite across every epoch
+        in a single vectorized C call, so Python overhead stays constant
+        as the catalog grows.
+        """
+        satellites = list(self.tle_cache.values())
+        satrecs = [sat.model for sat in satellites]
+
+        start_ts = time.time()
+        n_samples = int(time_window_hours * 3600 / self.COARSE_STEP_S) + 1
+        unix = start_ts + np.arange(n_samples) * self.COARSE_STEP_S
+
+        days = unix / 86400.0
+        fr, jd = np.modf(days)
+        jd += 2440587.5  # Unix epoch as Julian date
+
+        # One frame serves the bulk projection and all refinements
+        frame = _observer_frame_for(location)
+        elevation, azimuth = self._propagate_elevations(satrecs, jd, fr, frame)
+
+        # Most of the catalog never rises for a given observer; one
+        # vectorized check drops those before the per-satellite scan
+        visible = np.flatnonzero(
+            (elevation > min_elevation - self.COARSE_MARGIN_DEG).any(axis=1)
+        )
+
+        passes = []
+        for i in visible:
+            passes.extend(self._passes_from_samples(
+                satellites[i], unix, elevation[i], azimuth[i],
+                min_elevation, frame
+            ))
+
+        passes.sort(key=lambda p: p.start_time)
+        return passes
+
+    def _propagate_elevations(
+        self,
+        satrecs: list,
+        jd: np.ndarray,
+        fr: np.ndarray,
+        frame: Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Propagate satellites in bulk and project onto the observer sky
+
+        Returns (elevation, azimuth) arrays of shape (n_sats, n_epochs)
+        in degrees; epochs where SGP4 reported an error read -90.
+        """
+        e, r, _ = SatrecArray(satrecs).sgp4(jd, fr)
+
+        # Rotate TEME -> ECEF about the pole by GMST (polar motion is
+        # negligible for pass prediction)
+        gmst = _gmst_radians(jd + fr)
+        cos_g, sin_g = np.cos(gmst), np.sin(gmst)
+        x = cos_g * r[..., 0] + sin_g * r[..., 1]
+        y = -sin_g * r[..., 0] + cos_g * r[..., 1]
+        z = r[..., 2]
+
+        obs, east, north, up = frame
+        dx, dy, dz = x - obs[0], y - obs[1], z - obs[2]
+        d_east = dx * east[0] + dy * east[1]  # east[2] is zero
+        d_north = dx * north[0] + dy * north[1] + dz * north[2]
+        d_up = dx * up[0] + dy * up[1] + dz * up[2]
+
+        slant = np.sqrt(dx * dx + dy * dy + dz * dz)
+        elevation = np.degrees(np.arcsin(np.clip(d_up / slant, -1.0, 1.0)))
+        azimuth = np.degrees(np.arctan2(d_east, d_north)) % 360.0
+
+        elevation[e != 0] = -90.0
+        return elevation, azimuth
+
+    def _elevation_at(
+        self,
+        satrec,
+        frame: Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray],
+        unix_t: float
+    ) -> float:
+        """Elevation in degrees of one satellite at one Unix epoch"""
+        obs, _, _, up = frame
+
+        days = unix_t / 86400.0
+        fr = days % 1.0
+        jd = days - fr + 2440587.5
+        e, r, _ = satrec.sgp4(jd, fr)
+        if e != 0:
+            return -90.0
+
+        gmst = float(_gmst_radians(days + 2440587.5))
+        cos_g, sin_g = math.cos(gmst), math.sin(gmst)
+        x = cos_g * r[0] + sin_g * r[1]
+        y = -sin_g * r[0] + cos_g * r[1]
+        z = r[2]
+
+        dx, dy, dz = x - obs[0], y - obs[1], z - obs[2]
+        d_up = dx * up[0] + dy * up[1] + dz * up[2]
+        slant = math.sqrt(dx * dx + dy * dy + dz * dz)
+        return math.degrees(math.asin(max(-1.0, min(1.0, d_up / slant))))
+
+    def _passes_from_samples(
+        self,
+        satellite: EarthSatellite,
+        unix: np.ndarray,
+        elevation: np.ndarray,
+        azimuth: np.ndarray,
+        min_elevation: float,
+        frame: Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+    ) -> List[SatellitePass]:
+        """
+        Extract pass windows from one satellite's sampled sky track
+
+        Coarse samples locate each window; rise/set are then refined by
+        root-bracketing and the culmination by bounded minimization, so
+        the expensive per-epoch work stays at the coarse cadence.
+        """
+        above = np.flatnonzero(elevation >= min_elevation)
+        if above.size == 0:
+            return []
+
+        # Split the above-threshold samples into contiguous windows
+        segments = np.split(above, np.flatnonzero(np.diff(above) > 1) + 1)
+
+        satrec = satellite.model
+
+        def margin(t: float) -> float:
+            return self._elevation_at(satrec, frame, t) - min_elevation
+
+        passes = []
+        for segment in segments:
+            start, end = segment[0], segment[-1]
+            peak = segment[np.argmax(elevation[segment])]
+
+            rise_t = float(unix[start])
+            set_t = float(unix[end])
+            peak_t = float(unix[peak])
+            max_el = float(elevation[peak])
+
+            # Refine only where the coarse grid brackets the event
+            try:
+                if start > 0:
+                    rise_t = brentq(margin, unix[start - 1], unix[start], xtol=0.5)
+                if end + 1 < unix.size:
+                    set_t = brentq(margin, unix[end], unix[end + 1], xtol=0.5)
+            except ValueError:
+                pass  # no sign change at the bracket; keep coarse values
+
+            if 0 < peak < unix.size - 1:
+                result = minimize_scalar(
+                    lambda t: -self._elevation_at(satrec, frame, t),
+                    bounds=(float(unix[peak - 1]), float(unix[peak + 1])),
+                    method="bounded",
+                    options={"xatol": 0.5},
+                )
+                if result.success:
+                    peak_t = float(result.x)
+                    max_el = float(-result.fun)
+
+            duration = int(set_t - rise_t) or int(self.COARSE_STEP_S)
+            worth_watching = max_el > 40
+
+            passes.append(SatellitePass(
+                satellite_name=satellite.name,
+                satellite_id=satellite.model.satnum,
+                start_time=datetime.utcfromtimestamp(rise_t),
+                max_elevation_time=datetime.utcfromtimestamp(peak_t),
+                end_time=datetime.utcfromtimestamp(set_t),
+                max_elevation=max_el,
+                start_azimuth=float(azimuth[start]),
+                max_azimuth=float(azimuth[peak]),
+                end_azimuth=float(azimuth[end]),
+                magnitude=None,
+                duration_seconds=duration,
+                worth_watching=worth_watching,
+                commentary=self._generate_commentary(
+                    {"maxEl": max_el, "duration": duration}, worth_watching
+                )
+            ))
+
+        return passes
+
     def _generate_commentary(self, pass_data: dict, worth_watching: bool) -> str:
         """Generate human-friendly commentary about a pass"""
         max_el = pass_data["maxEl"]
@@ -193,23 +756,9 @@ class SatelliteService:
         
         if not worth_watching:
             return "Low pass, may not be easily visible."
-        
-        if max_el > 70:
-            visibility = "Overhead pass! Excellent viewing."
-        elif max_el > 50:
-            visibility = "High pass, very good viewing."
-        elif max_el > 30:
-            visibility = "Good pass, should be easy to spot."
-        else:
-            visibility = "Moderate pass, clear sky recommended."
-        
-        if duration < 180:
-            time_note = "Quick pass"
-        elif duration < 360:
-            time_note = "Standard duration"
-        else:
-            time_note = "Long pass"
-        
+
+        visibility = _MAX_EL_LABEL[bisect.bisect_left(_MAX_EL_THRESH, max_el)]
+        time_note = _DURATION_LABEL[bisect.bisect_right(_DURATION_THRESH, duration)]
         return f"{visibility} {time_note} ({duration}s)."
     
     async def get_satellite_profile(
@@ -217,66 +766,20 @@ class SatelliteService:
         satellite_name: str
     ) -> Optional[SatelliteProfile]:
         """Get detailed satellite profile"""
-        
+
         # Check if it's a known satellite
-        sat_info = None
-        for key, info in self.SATELLITES.items():
-            if key.lower() in satellite_name.lower() or \
-               info["name"].lower() in satellite_name.lower():
-                sat_info = info
-                satellite_name = key
-                break
-        
-        if not sat_info:
+        needle = satellite_name.lower()
+        satellite_name = next(
+            (key for alias, key in self._alias_index.items() if alias in needle),
+            None
+        )
+
+        if not satellite_name:
             return None
-        
-        # Return profile based on satellite
-        profiles = {
-            "ISS": SatelliteProfile(
-                satellite_id=25544,
-                name="International Space Station",
-                norad_id="25544",
-                purpose="Research laboratory and human spaceflight",
-                orbit_type=OrbitType.LEO,
-                altitude_km=408,
-                speed_kmh=27600,
-                country="International",
-                why_care="The ISS is a continuously inhabited space station where "
-                         "astronauts conduct scientific research in microgravity. "
-                         "It's the brightest satellite and often visible to the naked eye.",
-                recent_changes=None
-            ),
-            "HUBBLE": SatelliteProfile(
-                satellite_id=20580,
-                name="Hubble Space Telescope",
-                norad_id="20580",
-                purpose="Space telescope for astronomical observations",
-                orbit_type=OrbitType.LEO,
-                altitude_km=547,
-                speed_kmh=27300,
-                country="USA/ESA",
-                why_care="Hubble has revolutionized astronomy with stunning images "
-                         "and discoveries about the universe. Operating since 1990.",
-                recent_changes=None
-            ),
-            "TIANGONG": SatelliteProfile(
-                satellite_id=48274,
-                name="Tiangong Space Station",
-                norad_id="48274",
-                purpose="Chinese space station",
-                orbit_type=OrbitType.LEO,
-                altitude_km=390,
-                speed_kmh=27500,
-                country="China",
-                why_care="China's first long-term space station, continuously inhabited "
-                         "since 2022. Conducting scientific research and technology demos.",
-                recent_changes=None
-            ),
-        }
-        
-        return profiles.get(satellite_name)
+
+        return self._PROFILES.get(satellite_name)
     
-    def _get_demo_passes(self, location: Location) -> List[SatellitePass]:
+    def _get_demo_passes(self, location: LocationFast) -> List[SatellitePass]:
         """Return realistic demo data for passes"""
         now = datetime.utcnow()
         
@@ -284,40 +787,20 @@ class SatelliteService:
         tonight_7pm = now.replace(hour=19, minute=41, second=0, microsecond=0)
         if tonight_7pm < now:
             tonight_7pm += timedelta(days=1)
-        
+
+        # model_construct skips validation; the templates were vetted once
         return [
-            SatellitePass(
-                satellite_name="ISS (ZARYA)",
-                satellite_id=25544,
-                start_time=tonight_7pm,
-                max_elevation_time=tonight_7pm + timedelta(minutes=3),
-                end_time=tonight_7pm + timedelta(minutes=6),
-                max_elevation=63.0,
-                start_azimuth=225,  # SW
-                max_azimuth=180,
-                end_azimuth=45,  # NE
-                magnitude=-3.5,
-                duration_seconds=360,
-                worth_watching=True,
-                commentary="High pass, very good viewing. Standard duration (360s)."
-            ),
-            SatellitePass(
-                satellite_name="ISS (ZARYA)",
-                satellite_id=25544,
-                start_time=tonight_7pm + timedelta(hours=13),
-                max_elevation_time=tonight_7pm + timedelta(hours=13, minutes=2),
-                end_time=tonight_7pm + timedelta(hours=13, minutes=5),
-                max_elevation=45.0,
-                start_azimuth=270,
-                max_azimuth=180,
-                end_azimuth=90,
-                magnitude=-2.8,
-                duration_seconds=300,
-                worth_watching=True,
-                commentary="Good pass, should be easy to spot. Standard duration (300s)."
-            ),
+            SatellitePass.model_construct(
+                start_time=tonight_7pm + off_start,
+                max_elevation_time=tonight_7pm + off_max,
+                end_time=tonight_7pm + off_end,
+                **fields
+            )
+            for fields, off_start, off_max, off_end in _DEMO_PASS_TEMPLATES
         ]
 
 
-# Global service instance
-satellite_service = SatelliteService()
\ No newline at end of file
+@functools.lru_cache(maxsize=1)
+def get_satellite_service() -> SatelliteService:
+    """Shared service instance, built on first use rather than at import"""
+    return SatelliteService()
\ No newline at end of file
@@ -4,7 +4,9 @@ Background scheduler for periodic space data updates
 import asyncio
 from datetime import datetime
 import structlog
+from apscheduler.executors.asyncio import AsyncIOExecutor
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 
 from app.core.config import settings
@@ -37,9 +39,11 @@ async def update_space_weather():
 async def update_tle_data():
     """Periodic TLE (satellite orbit) data update"""
     try:
+        from app.services.satellite_service import get_satellite_service
+
         logger.info("Updating TLE data")
-        # TODO: Fetch latest TLE data from CelesTrak
-        logger.info("TLE data updated")
+        updated = await get_satellite_service().update_tle_cache()
+        logger.info("TLE data updated", satellites=updated)
     except Exception as e:
         logger.error("Failed to update TLE data", error=str(e))
 
@@ -52,8 +56,17 @@ async def start_scheduler():
         logger.warning("Scheduler already running")
         return
     
-    scheduler = AsyncIOScheduler()
-    
+    # Coalesce merges runs missed during pauses/restarts into one, and
+    # max_instances stops a slow fetch from stacking duplicate jobs
+    scheduler = AsyncIOScheduler(
+        executors={"default": AsyncIOExecutor()},
+        job_defaults={
+            "coalesce": True,
+            "max_instances": 1,
+            "misfire_grace_time": 60,
+        },
+    )
+
     # Space weather updates every 5 minutes
     scheduler.add_job(
         update_space_weather,
@@ -62,14 +75,18 @@ async def start_scheduler():
         name="Update space weather data",
         replace_existing=True,
     )
-    
-    # TLE data updates daily
+
+    # TLE refresh daily at 04:00 UTC; CelesTrak updates predictably, so
+    # an off-peak cron beats an interval anchored to process start.
+    # next_run_time fires the job once immediately so the cache (and the
+    # local pass-prediction path) is primed right after boot
     scheduler.add_job(
         update_tle_data,
-        trigger=IntervalTrigger(seconds=settings.TLE_UPDATE_INTERVAL),
+        trigger=CronTrigger(hour=4),
         id="tle_update",
         name="Update TLE data",
         replace_existing=True,
+        next_run_time=datetime.now(),
     )
     
     scheduler.start()
@@ -1,33 +1,65 @@
 """
 Space Weather monitoring service using NOAA SWPC data
 """
+import asyncio
+import bisect
 from datetime import datetime, timedelta
 from typing import List, Optional
+import orjson
 import structlog
-import httpx
 
 from app.core.config import settings
+from app.core.http import get_http_client
 from app.models.schemas import (
     KpIndex, SolarFlare, CME, SpaceWeatherStatus,
     SpaceWeatherImpact, AlertSeverity
 )
+from app.services._cache import async_cached
 
 logger = structlog.get_logger()
 
+# Kp description table: label index = bisect over the NOAA G-scale
+# boundaries, matching the original strict-< branch cascade
+_KP_THRESH = [4.0, 5.0, 6.0, 7.0, 8.0]
+_KP_DESC = [
+    "Quiet geomagnetic conditions",
+    "Unsettled geomagnetic conditions",
+    "Active geomagnetic conditions",
+    "Minor geomagnetic storm",
+    "Moderate geomagnetic storm",
+    "Strong geomagnetic storm",
+]
+
+# Static demo-status fields, validated once; _get_demo_status only adds
+# the per-call timestamps via model_construct
+_DEMO_STATUS_FIELDS = {
+    "kp_current": 5.0,
+    "kp_forecast_3h": 5.3,
+    "gps_degradation_risk": "minor",
+    "hf_radio_risk": "moderate",
+    "satellite_risk": "minor",
+    "aurora_visibility": "visible_high_latitudes",
+    "summary": "Status: Active geomagnetic conditions (Kp 5.0). "
+               "Minor GPS degradation possible; most users unaffected.",
+}
+_DEMO_FLARE_FIELDS = {"class_type": "M", "scale": 5.2, "region": "AR3590"}
+
 
 class SpaceWeatherService:
     """Service for space weather monitoring and forecasting"""
     
     def __init__(self):
         self.base_url = settings.NOAA_SWPC_BASE_URL
-        self._cache = {}
-        self._cache_ttl = 300  # 5 minutes
-    
+
+    @async_cached(ttl=settings.SPACE_WEATHER_CACHE_TTL)
     async def get_current_status(self) -> SpaceWeatherStatus:
         """
         Get current space weather status
-        
-        Returns comprehensive status including Kp, flares, CMEs, and impacts
+
+        Returns comprehensive status including Kp, flares, CMEs, and impacts.
+        Cached for SPACE_WEATHER_CACHE_TTL seconds; the decorator's per-key
+        lock also coalesces concurrent callers (scheduler tick plus user
+        requests) onto one NOAA fetch.
         """
         if settings.DEMO_MODE:
             return self._get_demo_status()
@@ -77,16 +109,16 @@ class SpaceWeatherService:
             summary=summary
         )
     
+    @async_cached(ttl=300)
     async def _get_current_kp(self) -> float:
-        """Fetch current Kp index from NOAA"""
+        """Fetch current Kp index from NOAA, cached for 5 minutes"""
         url = f"{self.base_url}/products/noaa-planetary-k-index-forecast.json"
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, timeout=10.0)
-                response.raise_for_status()
-                data = response.json()
-            
+            response = await get_http_client().get(url)
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+
             # NOAA returns array of arrays
             if isinstance(data, list) and len(data) > 1:
                 # Skip header row, get last data row
@@ -124,12 +156,14 @@ class SpaceWeatherService:
         """Assess HF radio degradation risk"""
         if not flares:
             return "none"
-        
-        # Check for recent strong flares
+
+        # Check for recent strong flares; total_seconds() keeps events
+        # older than a day from looking recent again
+        now = datetime.utcnow()
         recent_strong = [
-            f for f in flares 
-            if f.class_type in ["M", "X"] and 
-            (datetime.utcnow() - f.timestamp).seconds < 3600
+            f for f in flares
+            if f.class_type in ["M", "X"] and
+            (now - f.timestamp).total_seconds() < 3600
         ]
         
         if any(f.class_type == "X" for f in recent_strong):
@@ -173,21 +207,8 @@ class SpaceWeatherService:
         sat_risk: str
     ) -> str:
         """Generate human-readable status summary"""
-        
-        # Kp description
-        if kp < 4:
-            kp_desc = "Quiet geomagnetic conditions"
-        elif kp < 5:
-            kp_desc = "Unsettled geomagnetic conditions"
-        elif kp < 6:
-            kp_desc = "Active geomagnetic conditions"
-        elif kp < 7:
-            kp_desc = "Minor geomagnetic storm"
-        elif kp < 8:
-            kp_desc = "Moderate geomagnetic storm"
-        else:
-            kp_desc = "Strong geomagnetic storm"
-        
+
+        kp_desc = _KP_DESC[bisect.bisect_right(_KP_THRESH, kp)]
         summary = f"Status: {kp_desc} (Kp {kp:.1f})."
         
         # Add specific impacts if relevant
@@ -278,28 +299,19 @@ class SpaceWeatherService:
     
     def _get_demo_status(self) -> SpaceWeatherStatus:
         """Return demo space weather status"""
-        return SpaceWeatherStatus(
-            timestamp=datetime.utcnow(),
-            kp_current=5.0,
-            kp_forecast_3h=5.3,
+        now = datetime.utcnow()
+        return SpaceWeatherStatus.model_construct(
+            timestamp=now,
             recent_flares=[
-                SolarFlare(
-                    timestamp=datetime.utcnow() - timedelta(hours=3),
-                    class_type="M",
-                    scale=5.2,
-                    region="AR3590"
+                SolarFlare.model_construct(
+                    timestamp=now - timedelta(hours=3),
+                    **_DEMO_FLARE_FIELDS
                 )
             ],
             active_cmes=[],
-            gps_degradation_risk="minor",
-            hf_radio_risk="moderate",
-            satellite_risk="minor",
-            aurora_visibility="visible_high_latitudes",
-            summary="Status: Active geomagnetic conditions (Kp 5.0). "
-                   "Minor GPS degradation possible; most users unaffected."
+            **_DEMO_STATUS_FIELDS
         )
 
 
 # Global service instance
-import asyncio
 space_weather_service = SpaceWeatherService()
\ No newline at end of file
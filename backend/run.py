@@ -9,10 +9,13 @@ import structlog
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.core.config import settings
+from app.core.http import close_http_client, init_http_client
 from app.core.logging_config import setup_logging
 from app.api.routes import api_router
+from app.agents.space_agent import space_agent
 from app.services.scheduler import start_scheduler, stop_scheduler
 
 # Setup logging
@@ -27,7 +30,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     """
     # Startup
     logger.info("Starting Space Agent", environment=settings.ENVIRONMENT)
-    
+
+    # One outbound HTTP pool shared by all services, Claude included
+    http_client = init_http_client()
+    space_agent.set_http_client(http_client)
+
     if settings.ENABLE_SCHEDULER:
         logger.info("Starting background scheduler")
         await start_scheduler()
@@ -42,7 +49,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     if settings.ENABLE_SCHEDULER:
         logger.info("Stopping background scheduler")
         await stop_scheduler()
-    
+
+    await close_http_client()
+
     logger.info("Space Agent shut down complete")
 
 
@@ -52,6 +61,7 @@ app = FastAPI(
     description="Real-time space intelligence agent with satellite tracking, space weather monitoring, and AI-powered explanations",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/api/docs" if settings.DEBUG else None,
     redoc_url="/api/redoc" if settings.DEBUG else None,
 )
@@ -65,8 +75,26 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Compression middleware
-app.add_middleware(GZipMiddleware, minimum_size=1000)
+class SelectiveGZipMiddleware(GZipMiddleware):
+    """GZip middleware that leaves SSE streams uncompressed
+
+    Starlette gzips every streaming response for gzip-accepting clients
+    regardless of minimum_size, and zlib buffers the small data: deltas
+    until a block fills — holding the agent's answer until the stream
+    closes. Bypass compression for the streaming agent routes.
+    """
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "http" and scope["path"].endswith(":stream"):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
+# Compression middleware: most responses here (health, status, demo
+# pass lists) are small enough that gzip costs more CPU than it saves,
+# so only larger bodies are compressed, at a cheaper level
+app.add_middleware(SelectiveGZipMiddleware, minimum_size=4096, compresslevel=5)
 
 # Include API routes
 app.include_router(api_router, prefix="/api/v1")
@@ -100,5 +128,6 @@ if __name__ == "__main__":
         host=settings.API_HOST,
         port=settings.API_PORT,
         reload=settings.API_RELOAD and settings.DEBUG,
+        loop="uvloop",
         log_config=None,  # We use structlog
     )